@@ -0,0 +1,73 @@
+import contextlib
+import datetime
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+from pace import races
+from store import ResultsStore
+
+
+def generate_results(store, n, athletes=100_000, seed=0):
+    """
+    yields n random (athlete, race, time) results within the store's vdot range
+    """
+    rng = random.Random(seed)
+    for _ in range(n):
+        race = rng.choice(races)
+        times = store.race_times[race]
+        seconds = rng.randint(times[0], times[-1])
+        athlete = f"athlete {rng.randrange(athletes)}"
+        yield (athlete, race, datetime.timedelta(seconds=seconds))
+
+
+def benchmark(path, rows, chunk_size=1_000_000):
+    # start from an empty database so repeated runs time the same workload
+    for suffix in ("", "-wal", "-shm"):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path + suffix)
+    # trade durability on power loss and 256MB of page cache for ingest speed
+    store = ResultsStore(path, synchronous="NORMAL", cache_size=-262144)
+
+    # generate results a chunk at a time outside the timer so only the
+    # ingest itself is measured without holding every row in memory
+    results = generate_results(store, rows)
+    elapsed = 0.0
+    count = 0
+    store.drop_indexes()
+    while chunk := list(itertools.islice(results, chunk_size)):
+        start = time.perf_counter()
+        count += store.ingest(chunk)[0]
+        elapsed += time.perf_counter() - start
+    start = time.perf_counter()
+    store.create_indexes()
+    elapsed += time.perf_counter() - start
+    print(f"ingest: {count} rows in {elapsed:.2f}s ({count / elapsed:,.0f} rows/s)")
+
+    queries = {
+        "vdot range 55-60": lambda: store.get_vdot_range(55, 60),
+        "vdot range 84-85": lambda: store.get_vdot_range(84, 85),
+        "top 100": lambda: store.get_top_vdots(100),
+        "athlete": lambda: store.get_athlete_results("athlete 42"),
+    }
+    for name, query in queries.items():
+        start = time.perf_counter()
+        result = query()
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {len(result)} rows in {elapsed * 1000:.1f}ms")
+
+    store.close()
+
+
+if __name__ == "__main__":
+    # python bench_store.py [rows] [path], path defaults to a temporary file and
+    # any existing database at path is deleted first
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    if len(sys.argv) > 2:
+        benchmark(sys.argv[2], rows)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            benchmark(os.path.join(directory, "results.db"), rows)
@@ -223,6 +223,45 @@ class Model:
         distance = distances[race]
         return pace * distance
 
+    @staticmethod
+    def get_paces_from_vdots(vdots, keys):
+        """
+        returns {vdot: {key: pace}} for every vdot and key, evaluating the
+        regression once per cell as a single matrix product
+        """
+        vdots, keys = list(vdots), list(keys)
+        v = np.asarray(vdots, dtype=float)
+        X = np.column_stack([np.ones_like(v), v, np.log(v), 1 / v, v**2, v**3])
+        W = np.column_stack([pace_coefs[key] for key in keys])
+        seconds = np.round(X @ W)
+        return {
+            vdot: {
+                key: datetime.timedelta(seconds=s) for key, s in zip(keys, row)
+            }
+            for vdot, row in zip(vdots, seconds)
+        }
+
+    def get_tables(self, vdots):
+        """
+        returns training intensity paces and race paces (both per km) and
+        race times for the vdots, from one evaluation of the model per
+        (vdot, key) cell
+        """
+        vdots = list(vdots)
+        paces = self.get_paces_from_vdots(vdots, training_intensities + races)
+        training_intensity_paces = {
+            v: {k: paces[v][k] for k in training_intensities} for v in vdots
+        }
+        race_paces = {v: {race: paces[v][race] for race in races} for v in vdots}
+        race_times = {
+            v: {
+                race: Model.calculate_time(distances[race], pace)
+                for race, pace in race_paces[v].items()
+            }
+            for v in vdots
+        }
+        return training_intensity_paces, race_paces, race_times
+
     @staticmethod
     def calculate_pace(time: datetime.timedelta, distance: float) -> datetime.timedelta:
         return time / distance
@@ -447,12 +486,8 @@ class View(ttk.Frame):
 
     def refresh_button_clicked(self):
         if self.controller:
-            self.controller.validate_vdot(int(self.vdot.get()))
-            self.controller.get_training_intensity_paces(
-                int(self.vdot.get()), self.km_mi.get()
-            )
-            self.controller.get_race_paces(int(self.vdot.get()), self.km_mi.get())
-            self.controller.get_race_times(int(self.vdot.get()), self.km_mi.get())
+            if self.controller.validate_vdot(int(self.vdot.get())):
+                self.controller.refresh(int(self.vdot.get()), self.km_mi.get())
 
     def calculate_button_clicked(self):
         time = {
@@ -494,9 +529,10 @@ class Controller:
 
     def validate_vdot(self, vdot):
         try:
-            self.model.check_valid_vdot(vdot)
+            return self.model.check_valid_vdot(vdot)
         except ValueError as error:
             self.view.show_error(error)
+            return False
 
     def timedelta_to_tuple(self, td):
         hours, remainder = divmod(int(np.round(td.total_seconds(), 0)), 3600)
@@ -536,60 +572,31 @@ class Controller:
             pace=self.timedelta_to_tuple(pace),
         )
 
-    def get_training_intensity_paces(self, vdot, km_mi):
+    def get_tables(self, vdots, km_mi):
         """
-        returns dictionary of paces for all avalible training_intensities over a range of vdots
+        returns training intensity paces, race paces and race times over a
+        range of vdots, with paces in the user selected km or miles
         """
-        # get training_intensities from Model
-        results = {}
-        for v in range(vdot - 2, vdot + 3):
-            try:
-                results[v] = {
-                    pace: self.model.get_pace_from_vdot_and_intensity(v, pace)
-                    for pace in training_intensities
-                }
-                if km_mi == "mi":
-                    results[v] = dict(
-                        (k, Model.convert_pace_km_to_miles(v))
-                        for k, v in results[v].items()
-                    )
-            except:
-                continue
-        # output to View
-        self.view.print_training_intensity_paces_to_table(results, vdot)
-
-    def get_race_paces(self, vdot, km_mi):
-        # get race from Model
-        results = {}
-        for v in range(vdot - 2, vdot + 3):
-            try:
-                results[v] = {
-                    race: self.model.get_pace_from_vdot_and_intensity(v, race)
-                    for race in races
-                }
-                if km_mi == "mi":
-                    results[v] = dict(
-                        (k, Model.convert_pace_km_to_miles(v))
-                        for k, v in results[v].items()
-                    )
-            except:
-                continue
-        # output to View
-        self.view.print_race_pace_to_table(results, vdot)
-
-    def get_race_times(self, vdot, km_mi):
-        # get race from Model
-        results = {}
-        for v in range(vdot - 2, vdot + 3):
-            try:
-                results[v] = {
-                    race: self.model.get_time_from_vdot_and_race(v, race)
-                    for race in races
-                }
-            except:
-                continue
+        training_intensity_paces, race_paces, race_times = self.model.get_tables(
+            vdots
+        )
+        if km_mi == "mi":
+            for table in (training_intensity_paces, race_paces):
+                for paces in table.values():
+                    for k, pace in paces.items():
+                        paces[k] = Model.convert_pace_km_to_miles(pace)
+        return training_intensity_paces, race_paces, race_times
+
+    def refresh(self, vdot, km_mi):
+        training_intensity_paces, race_paces, race_times = self.get_tables(
+            range(vdot - 2, vdot + 3), km_mi
+        )
         # output to View
-        self.view.print_race_time_to_table(results, vdot)
+        self.view.print_training_intensity_paces_to_table(
+            training_intensity_paces, vdot
+        )
+        self.view.print_race_pace_to_table(race_paces, vdot)
+        self.view.print_race_time_to_table(race_times, vdot)
 
 
 class App(tk.Tk):
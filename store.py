@@ -0,0 +1,194 @@
+import bisect
+import itertools
+import sqlite3
+
+from pace import Model, races, training_intensities
+
+create_table_sql = f"""
+    CREATE TABLE IF NOT EXISTS results (
+        id INTEGER PRIMARY KEY,
+        athlete TEXT NOT NULL,
+        race TEXT NOT NULL,
+        time INTEGER NOT NULL,
+        vdot INTEGER NOT NULL,
+        {", ".join(f"{k} INTEGER NOT NULL" for k in training_intensities)}
+    )
+"""
+
+create_index_sql = [
+    "CREATE INDEX IF NOT EXISTS results_athlete ON results (athlete)",
+    "CREATE INDEX IF NOT EXISTS results_vdot ON results (vdot)",
+]
+
+drop_index_sql = [
+    "DROP INDEX IF EXISTS results_athlete",
+    "DROP INDEX IF EXISTS results_vdot",
+]
+
+columns = ["athlete", "race", "time", "vdot"] + training_intensities
+
+insert_sql = (
+    f"INSERT INTO results ({', '.join(columns)}) "
+    f"VALUES ({', '.join('?' for _ in columns)})"
+)
+
+select_sql = f"SELECT {', '.join(columns)} FROM results"
+
+vdot_range_sql = f"{select_sql} WHERE vdot BETWEEN ? AND ? ORDER BY vdot DESC"
+
+top_vdots_sql = f"{select_sql} ORDER BY vdot DESC LIMIT ?"
+
+athlete_sql = f"{select_sql} WHERE athlete = ? ORDER BY vdot DESC"
+
+synchronous_values = ["OFF", "NORMAL", "FULL", "EXTRA", 0, 1, 2, 3]
+
+
+class ResultsStore:
+    """
+    sqlite backed store of race results with their computed vdot and
+    training_intensities paces, all held as integer seconds (paces per km).
+    synchronous and cache_size set the matching sqlite pragmas when given,
+    otherwise the sqlite defaults are kept
+    """
+
+    def __init__(
+        self, path=":memory:", batch_size=50_000, synchronous=None, cache_size=None
+    ):
+        self.model = Model()
+        self.batch_size = batch_size
+        if synchronous is not None and (
+            isinstance(synchronous, bool) or synchronous not in synchronous_values
+        ):
+            raise ValueError(
+                (
+                    f"synchronous {synchronous!r} needs to be one of "
+                    f"{', '.join(map(str, synchronous_values))}"
+                )
+            )
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA temp_store = MEMORY")
+        if synchronous is not None:
+            self.connection.execute(f"PRAGMA synchronous = {synchronous}")
+        if cache_size is not None:
+            self.connection.execute(f"PRAGMA cache_size = {int(cache_size)}")
+        with self.connection:
+            self.connection.execute(create_table_sql)
+        self.create_indexes()
+
+        # the model only depends on the integer vdot, so evaluate it once per
+        # vdot up front and ingest becomes lookups rather than regressions
+        self.vdots = list(range(self.model.vdot_max, self.model.vdot_min - 1, -1))
+        training_intensity_paces, _, race_times = self.model.get_tables(self.vdots)
+        # predicted race times are rounded to whole seconds the same way
+        # ingest rounds result times, so a result that matches a prediction
+        # lands on that prediction's vdot
+        self.race_times = {
+            race: [round(race_times[v][race].total_seconds()) for v in self.vdots]
+            for race in races
+        }
+        self.paces = {
+            v: tuple(pace.seconds for pace in training_intensity_paces[v].values())
+            for v in self.vdots
+        }
+        # every whole second within each race's range mapped to the vdot and
+        # paces columns of its row, so ingest needs one dict lookup per result
+        self.rows = {
+            (race, seconds): (vdot,) + self.paces[vdot]
+            for race, times in self.race_times.items()
+            for seconds in range(times[0], times[-1] + 1)
+            for vdot in [self.get_vdot_from_race_time(race, seconds)]
+        }
+
+    def close(self):
+        self.connection.close()
+
+    def create_indexes(self):
+        with self.connection:
+            for sql in create_index_sql:
+                self.connection.execute(sql)
+
+    def drop_indexes(self):
+        with self.connection:
+            for sql in drop_index_sql:
+                self.connection.execute(sql)
+
+    def get_vdot_from_race_time(self, race, seconds):
+        """
+        returns the highest vdot whose predicted race time, rounded to whole
+        seconds, is no faster than seconds
+        """
+        if race not in self.race_times:
+            raise ValueError(f"Unknown race {race}")
+        times = self.race_times[race]
+        if not times[0] <= seconds <= times[-1]:
+            raise ValueError(
+                (
+                    f"{race} time of {seconds}s outside acceptable range of "
+                    f"VDOT {self.model.vdot_min} to {self.model.vdot_max}"
+                )
+            )
+        return self.vdots[bisect.bisect_left(times, seconds)]
+
+    def ingest(self, results, rebuild_indexes=False):
+        """
+        inserts an iterable of (athlete, race, time) results in batches of
+        batch_size, all within a single transaction, and returns the number of
+        rows inserted along with the list of results that were skipped because
+        their time is outside the vdot range. any other error rolls back the
+        whole ingest. rebuild_indexes drops the indexes for the duration of the
+        load, which is faster when the load is large relative to the table
+        """
+        if rebuild_indexes:
+            self.drop_indexes()
+        rows = self.rows
+        count = 0
+        skipped = []
+        results = iter(results)
+        try:
+            with self.connection:
+                while True:
+                    batch = []
+                    append = batch.append
+                    for result in itertools.islice(results, self.batch_size):
+                        athlete, race, result_time = result
+                        seconds = round(result_time.total_seconds())
+                        row = rows.get((race, seconds))
+                        if row is not None:
+                            append((athlete, race, seconds) + row)
+                        elif race in self.race_times:
+                            skipped.append(result)
+                        else:
+                            raise ValueError(f"Unknown race {race}")
+                    if not batch:
+                        break
+                    self.connection.executemany(insert_sql, batch)
+                    count += len(batch)
+        finally:
+            if rebuild_indexes:
+                self.create_indexes()
+        return count, skipped
+
+    def get_vdot_range(self, vdot_min, vdot_max):
+        """
+        returns all results with vdot_min <= vdot <= vdot_max, highest vdot first
+        """
+        self.model.check_valid_vdot(vdot_min)
+        self.model.check_valid_vdot(vdot_max)
+        return self.connection.execute(vdot_range_sql, (vdot_min, vdot_max)).fetchall()
+
+    def get_top_vdots(self, n):
+        """
+        returns the n results with the highest vdot
+        """
+        if not isinstance(n, int):
+            raise TypeError("n needs to be an int")
+        if n < 1:
+            raise ValueError(f"n of {n} needs to be at least 1")
+        return self.connection.execute(top_vdots_sql, (n,)).fetchall()
+
+    def get_athlete_results(self, athlete):
+        """
+        returns all results for athlete, highest vdot first
+        """
+        return self.connection.execute(athlete_sql, (athlete,)).fetchall()
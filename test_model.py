@@ -0,0 +1,38 @@
+import unittest
+import pace
+
+
+class TestModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = pace.Model()
+
+    def tearDown(self):
+        None
+
+    def test_get_tables_matches_per_cell(self):
+        # includes the +-2 window either side of the valid range that the
+        # GUI shows for a vdot of 30 or 85
+        vdots = range(28, 88)
+        training_intensity_paces, race_paces, race_times = self.model.get_tables(vdots)
+        self.assertEqual(list(training_intensity_paces), list(vdots))
+        for v in vdots:
+            for k in pace.training_intensities:
+                expected = pace.Model.get_pace_from_vdot_and_intensity(v, k)
+                self.assertEqual(training_intensity_paces[v][k], expected)
+            for race in pace.races:
+                expected = pace.Model.get_pace_from_vdot_and_intensity(v, race)
+                self.assertEqual(race_paces[v][race], expected)
+                expected = pace.Model.get_time_from_vdot_and_race(v, race)
+                self.assertEqual(race_times[v][race], expected)
+
+    def test_get_paces_from_vdots_accepts_generators(self):
+        vdots = (v for v in range(50, 53))
+        keys = (k for k in pace.training_intensities)
+        paces = pace.Model.get_paces_from_vdots(vdots, keys)
+        self.assertEqual(list(paces), [50, 51, 52])
+        self.assertEqual(list(paces[50]), pace.training_intensities)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+import datetime
+import unittest
+import pace
+from store import ResultsStore
+
+
+class TestResultsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ResultsStore(":memory:", batch_size=2)
+        self.times = self.store.race_times["5k"]
+
+    def tearDown(self):
+        self.store.close()
+
+    def count(self):
+        sql = "SELECT COUNT(*) FROM results"
+        return self.store.connection.execute(sql).fetchone()[0]
+
+    def one_result_per_vdot(self):
+        return [
+            (str(v), "5k", datetime.timedelta(seconds=self.times[85 - v]))
+            for v in range(30, 86)
+        ]
+
+    def indexes(self):
+        return {
+            name for name, in self.store.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+
+    def test_get_vdot_from_race_time_boundaries(self):
+        # race_times run from vdot 85 (fastest) down to vdot 30 (slowest)
+        t50, t51 = self.times[85 - 50], self.times[85 - 51]
+        self.assertEqual(self.store.get_vdot_from_race_time("5k", t50), 50)
+        self.assertEqual(self.store.get_vdot_from_race_time("5k", t50 + 1), 49)
+        self.assertEqual(self.store.get_vdot_from_race_time("5k", t51 + 1), 50)
+        self.assertEqual(self.store.get_vdot_from_race_time("5k", self.times[0]), 85)
+        self.assertEqual(self.store.get_vdot_from_race_time("5k", self.times[-1]), 30)
+
+    def test_ingest_boundaries_non_integer_distances(self):
+        # races like the mile and marathon have predicted times with
+        # fractional seconds, a result matching or just beating a prediction
+        # must still get that prediction's vdot
+        model = pace.Model()
+        results = [
+            (f"{race} {v}", race, model.get_time_from_vdot_and_race(v, race))
+            for race in pace.races
+            for v in range(30, 86)
+        ]
+        self.assertEqual(self.store.ingest(results)[0], len(results))
+        for athlete, race, _ in results:
+            vdot = self.store.get_athlete_results(athlete)[0][3]
+            self.assertEqual(vdot, int(athlete.split()[-1]), athlete)
+        mile = datetime.timedelta(seconds=218.82)
+        self.store.ingest([("mile", "1 mile", mile)])
+        self.assertEqual(self.store.get_athlete_results("mile")[0][3], 85)
+
+    def test_get_vdot_from_race_time_out_of_range(self):
+        get_vdot = self.store.get_vdot_from_race_time
+        self.assertRaises(ValueError, get_vdot, "5k", self.times[0] - 1)
+        self.assertRaises(ValueError, get_vdot, "5k", self.times[-1] + 1)
+        self.assertRaises(ValueError, get_vdot, "6k", self.times[0])
+
+    def test_ingest(self):
+        seconds = self.times[85 - 50]
+        result = ("a", "5k", datetime.timedelta(seconds=seconds))
+        count, skipped = self.store.ingest([result])
+        self.assertEqual((count, skipped), (1, []))
+        row = self.store.get_athlete_results("a")[0]
+        athlete, race, time, vdot, e, m, t, i, r = row
+        self.assertEqual((athlete, race, time, vdot), ("a", "5k", seconds, 50))
+        t_pace = pace.Model.get_pace_from_vdot_and_intensity(50, "t")
+        self.assertEqual(t, t_pace.seconds)
+
+    def test_ingest_skips_out_of_range(self):
+        valid = [("a", "5k", datetime.timedelta(seconds=self.times[10]))] * 3
+        slow = ("b", "5k", datetime.timedelta(minutes=35))
+        fast = ("c", "5k", datetime.timedelta(minutes=10))
+        count, skipped = self.store.ingest(valid + [slow, fast])
+        self.assertEqual((count, skipped), (3, [slow, fast]))
+        self.assertEqual(self.count(), 3)
+
+    def test_ingest_unknown_race_rolls_back(self):
+        valid = [("a", "5k", datetime.timedelta(seconds=self.times[10]))] * 3
+        unknown = ("b", "6k", datetime.timedelta(minutes=20))
+        self.assertRaises(ValueError, self.store.ingest, valid + [unknown])
+        self.assertEqual(self.count(), 0)
+
+    def test_ingest_rebuild_indexes(self):
+        expected = {"results_athlete", "results_vdot"}
+        self.assertEqual(self.indexes(), expected)
+        valid = [("a", "5k", datetime.timedelta(seconds=self.times[10]))] * 3
+        self.store.ingest(valid, rebuild_indexes=True)
+        self.assertEqual(self.indexes(), expected)
+        self.assertEqual(self.count(), 3)
+        unknown = ("b", "6k", datetime.timedelta(minutes=20))
+        self.assertRaises(
+            ValueError, self.store.ingest, [unknown], rebuild_indexes=True
+        )
+        self.assertEqual(self.indexes(), expected)
+
+    def test_get_vdot_range(self):
+        self.store.ingest(self.one_result_per_vdot())
+        vdots = [row[3] for row in self.store.get_vdot_range(55, 60)]
+        self.assertEqual(vdots, list(range(60, 54, -1)))
+        self.assertRaises(ValueError, self.store.get_vdot_range, 29, 60)
+        self.assertRaises(TypeError, self.store.get_vdot_range, "55", 60)
+
+    def test_synchronous(self):
+        for synchronous in ("NORMAL", 0):
+            ResultsStore(synchronous=synchronous).close()
+        for synchronous in ("normal; DROP TABLE results", "fast", 4, True):
+            self.assertRaises(ValueError, ResultsStore, synchronous=synchronous)
+
+    def test_get_top_vdots(self):
+        self.store.ingest(self.one_result_per_vdot())
+        self.assertEqual([row[3] for row in self.store.get_top_vdots(3)], [85, 84, 83])
+        self.assertRaises(ValueError, self.store.get_top_vdots, 0)
+        self.assertRaises(ValueError, self.store.get_top_vdots, -1)
+        self.assertRaises(TypeError, self.store.get_top_vdots, "3")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)